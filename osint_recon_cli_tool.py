@@ -1,9 +1,24 @@
+import os
+import re
 import sys
-import requests
-import random
+import json
 import time
-from playwright.sync_api import sync_playwright
-from urllib.parse import urlparse
+import queue
+import logging
+import logging.handlers
+import asyncio
+import aiohttp
+import random
+from collections import defaultdict
+from contextlib import asynccontextmanager, AsyncExitStack
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import uvloop
+except ImportError:
+    # Optional, and not available on Windows
+    uvloop = None
 
 # ANSI Colors 
 class Colors:
@@ -14,6 +29,49 @@ class Colors:
     BOLD = "\033[1m"
     WARNING = "\033[93m"
 
+# Set OSINT_DEBUG=1 to see per-check debug output
+DEBUG = bool(os.environ.get("OSINT_DEBUG"))
+
+log = logging.getLogger("osint_recon")
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# HTTP probes decide a site from status + Location alone.
+# They return True/False, or None when Playwright is still needed.
+def probe_instagram(status, location, username):
+    if status == 404:
+        return False
+    if status in REDIRECT_STATUSES and "/accounts/login" in location:
+        # Login wall that points back at the profile means it exists
+        next_paths = parse_qs(urlparse(location).query).get("next", [])
+        return any(path.lower() == f"/{username.lower()}/" for path in next_paths) or None
+    return None
+
+def probe_snapchat(status, location, username):
+    if status == 404:
+        return False
+    if status in REDIRECT_STATUSES and "/explore" in location:
+        return False
+    return None
+
+# Landing checks run on the browser's final URL after a 200.
+# They return True when the page still shows the profile.
+def landed_instagram(current_url, username):
+    # Still on the profile page, not bounced to login
+    return f"/{username}/" in current_url and "login" not in current_url
+
+def landed_twitter(current_url, username):
+    # Still on the profile URL, not sent home
+    return f"/{username}" in current_url and "home" not in current_url
+
+def landed_snapchat(current_url, username):
+    # Not redirected to the explore page
+    return "/explore/" not in current_url and username.lower() in current_url.lower()
+
 # OSINT categories
 CATEGORIES = {
     "1": {
@@ -22,7 +80,10 @@ CATEGORIES = {
             "Instagram": {
                 "url": "https://www.instagram.com/{}/",
                 "method": "playwright",
-                "success_indicators": ['profilePage_', '"username":"{}"', 'content="@{}'],
+                "min_interval": 2.0,
+                "probe": probe_instagram,
+                "landed": landed_instagram,
+                "success_indicators": ['meta[content*="@{}" i]'],
                 "failure_indicators": ["Sorry, this page isn't available", "User not found"]
             },
             "Facebook": {
@@ -34,13 +95,18 @@ CATEGORIES = {
             "Twitter": {
                 "url": "https://x.com/{}/",
                 "method": "playwright", 
-                "success_indicators": ['data-testid="UserName"', 'data-testid="UserDescription"'],
+                "landed": landed_twitter,
+                "dom_selector": '[data-testid="UserName"]',
+                "success_indicators": ['[data-testid="UserName"]', '[data-testid="UserDescription"]'],
                 "failure_indicators": ["This account doesn't exist", "Account suspended"]
             },
             "Snapchat": {
                 "url": "https://www.snapchat.com/add/{}/",
                 "method": "playwright",
-                "success_indicators": ['data-testid="add-friend-button"', 'snapcode'],
+                "dom_selector": '[data-testid="add-friend-button"]',
+                "probe": probe_snapchat,
+                "landed": landed_snapchat,
+                "success_indicators": ['[data-testid="add-friend-button"]', '[src*="snapcode"]'],
                 "failure_indicators": ["Hmm, couldn't find", "User not found"]
             }
         }
@@ -57,6 +123,9 @@ CATEGORIES = {
             "GitHub": {
                 "url": "https://api.github.com/users/{}",
                 "method": "requests",
+                "status_only": True,
+                # Authenticated calls get 5000 requests/hour instead of 60
+                "token_env": "GITHUB_TOKEN",
                 "success_indicators": [],
                 "failure_indicators": []
             }
@@ -71,6 +140,19 @@ CATEGORIES = {
 # Combine all sites for option 3
 CATEGORIES["3"]["sites"] = {**CATEGORIES["1"]["sites"], **CATEGORIES["2"]["sites"]}
 
+def compile_indicators(indicators):
+    """One case-insensitive bytes alternation, so content is scanned once for all patterns"""
+    if not indicators:
+        return None
+    return re.compile(b"|".join(re.escape(i.encode()) for i in indicators), re.IGNORECASE)
+
+# Compile failure text once at import for the streamed HTTP content scan
+for _site_config in CATEGORIES["3"]["sites"].values():
+    _failure_indicators = _site_config.get("failure_indicators", [])
+    _site_config["_failure_re"] = compile_indicators(_failure_indicators)
+    # Bytes carried between chunks so a match split across them is still seen
+    _site_config["_failure_overlap"] = max((len(i.encode()) for i in _failure_indicators), default=1) - 1
+
 OSINT_TIPS = [
     "With great power comes great responsibility.",
     "Always cross-check usernames across multiple platforms.",
@@ -79,172 +161,541 @@ OSINT_TIPS = [
     "Be aware of privacy and legal considerations while doing OSINT."
 ]
 
-def setup_browser_context(browser):
+# Colored output, assembled once at import
+RULE = f"{Colors.OKBLUE}{'='*50}{Colors.ENDC}"
+MENU = "\n".join([
+    f"\n{Colors.OKBLUE}{Colors.BOLD}🔍 OSINT Recon CLI Tool{Colors.ENDC}",
+    f"{Colors.OKBLUE}{Colors.BOLD}Choose category to check:{Colors.ENDC}",
+    "1 - Social Sites (Instagram, Facebook, Twitter, Snapchat)",
+    "2 - Tech Side (LinkedIn, GitHub)",
+    "3 - All Sites",
+])
+HEADER_TMPL = f"\n{RULE}\n{Colors.OKBLUE}[*] Checking {Colors.BOLD}{{users}}{Colors.ENDC}{Colors.OKBLUE} across {{category}}...{Colors.ENDC}\n{RULE}"
+RESULTS_TMPL = f"\n{RULE}\n{Colors.BOLD}📊 Results for {{username}}:{Colors.ENDC}\n{'-' * 40}"
+FOUND_TMPL = f"{Colors.OKGREEN}✅ [Found] {{site}}: {{message}}{Colors.ENDC}"
+NOT_FOUND_TMPL = f"{Colors.FAIL}❌ [Not Found] {{site}}{Colors.ENDC}"
+UNKNOWN_TMPL = f"{Colors.WARNING}⚠️  [{{message}}] {{site}}{Colors.ENDC}"
+SCORE_TMPL = f"\n{Colors.OKBLUE}📈 Possibility Score: {Colors.BOLD}{{score}}%{Colors.ENDC}"
+TIP_TMPL = f"{Colors.OKBLUE}💡 OSINT Tip: {{tip}}{Colors.ENDC}"
+
+# Resources username detection never reads
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Analytics/ad hosts whose scripts are skipped
+TRACKER_HOSTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "connect.facebook.net",
+    "scorecardresearch.com",
+    "ads-twitter.com",
+)
+
+# Max in-flight requests to any single host
+HOST_CONCURRENCY = 2
+# Start spreading requests out once a host reports fewer calls left than this
+RATE_LIMIT_LOW_WATER = 5
+
+class HostLimiter:
+    """Per-host concurrency limit with optional spacing between requests"""
+    def __init__(self, concurrency=HOST_CONCURRENCY):
+        self.host_sems = defaultdict(lambda: asyncio.Semaphore(concurrency))
+        self.next_slot = defaultdict(float)
+        # Spacing learned from the host's own rate-limit headers
+        self.adaptive_interval = defaultdict(float)
+
+    @asynccontextmanager
+    async def limit(self, url, min_interval=0):
+        host = urlparse(url).netloc
+        async with self.host_sems[host]:
+            interval = max(min_interval, self.adaptive_interval[host])
+            if interval:
+                # Reserve the next free slot for this host, then wait for it
+                now = asyncio.get_running_loop().time()
+                delay = self.next_slot[host] - now
+                self.next_slot[host] = max(now, self.next_slot[host]) + interval
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield
+
+    def update_from_headers(self, url, headers):
+        """Slow down a host that reports it is close to its rate limit"""
+        remaining = headers.get("X-RateLimit-Remaining", "")
+        reset = headers.get("X-RateLimit-Reset", "")
+        if not (remaining.isdigit() and reset.isdigit()):
+            return
+        
+        host = urlparse(url).netloc
+        remaining = int(remaining)
+        if remaining < RATE_LIMIT_LOW_WATER:
+            # Spread what is left of the quota over the time until it resets
+            seconds_left = max(int(reset) - time.time(), 0)
+            self.adaptive_interval[host] = min(seconds_left / max(remaining, 1), MAX_BACKOFF)
+        else:
+            self.adaptive_interval[host] = 0
+
+# Responses worth retrying, with capped exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
+MAX_BACKOFF = 30
+
+def is_rate_limited(status, headers):
+    """429, or a 403 with no quota left, which is how GitHub signals it"""
+    if status == 429:
+        return True
+    return status == 403 and headers.get("X-RateLimit-Remaining") == "0"
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff: 0..2**attempt seconds, capped"""
+    return random.uniform(0, min(MAX_BACKOFF, 2 ** attempt))
+
+def retry_delay(response, attempt):
+    """Honor Retry-After / X-RateLimit-Reset when the server sends them.
+
+    Server-given waits are returned uncapped, so callers can tell when
+    one is too long to wait out.
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return int(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset", "")
+    if is_rate_limited(response.status, response.headers) and reset.isdigit():
+        return max(int(reset) - time.time(), 0)
+    return backoff_delay(attempt)
+
+@asynccontextmanager
+async def request_with_retry(session, method, url, **kwargs):
+    """session.request that retries rate limits, 5xx and connection errors.
+
+    The final attempt's response is yielded whatever its status, as is
+    any response whose required wait is longer than MAX_BACKOFF.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        
+        retryable = response.status in RETRY_STATUSES or is_rate_limited(response.status, response.headers)
+        delay = retry_delay(response, attempt) if retryable and not last_attempt else None
+        # Report a long server-imposed pause instead of sleeping through it
+        if delay is not None and delay <= MAX_BACKOFF:
+            response.release()
+            log.debug("%s[DEBUG] %s from %s, retrying in %.1fs%s", Colors.WARNING, response.status, url, delay, Colors.ENDC)
+            await asyncio.sleep(delay)
+            continue
+        
+        try:
+            yield response
+        finally:
+            response.release()
+        return
+
+def status_result(status, headers):
+    """Result for a non-200 status; only a real miss counts as Not Found"""
+    if is_rate_limited(status, headers):
+        return False, "Rate limited"
+    if status in RETRY_STATUSES:
+        return False, "Error checking"
+    return False, "Not Found"
+
+# Disk cache of past results, keyed on (site, username)
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".osint_recon", "cache.json")
+FOUND_TTL = 3600
+# Shorter for misses, since a free username can be claimed at any time
+NOT_FOUND_TTL = 300
+
+class ResultCache:
+    """Site results kept in memory and persisted to disk with a TTL"""
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _key(site_name, username):
+        return f"{site_name}:{username.lower()}"
+
+    def get(self, site_name, username):
+        entry = self.entries.get(self._key(site_name, username))
+        if entry and entry["expires"] > time.time():
+            return tuple(entry["result"])
+        return None
+
+    def set(self, site_name, username, result):
+        found, message = result
+        # Errors and rate limits are transient, always retry them next time
+        if not found and message != "Not Found":
+            return
+        ttl = FOUND_TTL if found else NOT_FOUND_TTL
+        self.entries[self._key(site_name, username)] = {"result": [found, message], "expires": time.time() + ttl}
+
+    def save(self):
+        now = time.time()
+        self.entries = {key: entry for key, entry in self.entries.items() if entry["expires"] > now}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning("%s[!] Could not save cache: %s%s", Colors.WARNING, e, Colors.ENDC)
+
+async def block_heavy_resources(route):
+    """Abort images, fonts, media, stylesheets and tracker scripts"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return await route.abort()
+    if request.resource_type == "script" and urlparse(request.url).netloc.endswith(TRACKER_HOSTS):
+        return await route.abort()
+    return await route.continue_()
+
+async def setup_browser_context(browser):
     """Setup browser context with realistic settings"""
-    context = browser.new_context(
+    context = await browser.new_context(
         viewport={'width': 1920, 'height': 1080},
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        user_agent=DEFAULT_HEADERS['User-Agent']
     )
+    await context.route("**/*", block_heavy_resources)
     return context
 
-def check_with_playwright(username, site_config):
-    """Enhanced Playwright checking with better detection"""
+# Browser contexts checked in parallel inside the one Chromium
+MAX_BROWSER_CONTEXTS = 4
+
+class BrowserPool:
+    """Headless Chromium kept alive for the whole run.
+
+    Each check borrows one of `size` isolated contexts, so that many
+    Playwright checks run in parallel across Chromium's processes.
+    """
+    def __init__(self, size=MAX_BROWSER_CONTEXTS):
+        self.size = size
+        self.pw = None
+        self.browser = None
+        self.contexts = asyncio.Queue()
+
+    async def __aenter__(self):
+        self.pw = await async_playwright().start()
+        try:
+            self.browser = await self.pw.chromium.launch(headless=True)
+            for _ in range(self.size):
+                self.contexts.put_nowait(await setup_browser_context(self.browser))
+        except Exception:
+            # Don't leave Chromium or the driver running after a partial start
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+        await self.pw.stop()
+
+    async def acquire_page(self):
+        # Waits without blocking the loop while every context is busy
+        context = await self.contexts.get()
+        try:
+            return await context.new_page()
+        except Exception:
+            self.contexts.put_nowait(context)
+            raise
+
+    async def release_page(self, page):
+        # A fresh page per check; closing it hands the context back
+        try:
+            await page.close()
+        except Exception:
+            pass
+        self.contexts.put_nowait(page.context)
+
+async def open_browser_pool(stack, browser_checks):
+    """BrowserPool for browser_checks entered on stack; None if not needed or Chromium fails"""
+    if not browser_checks:
+        return None
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = setup_browser_context(browser)
-            page = context.new_page()
-            
-            # Navigate to the URL
-            url = site_config["url"].format(username)
-            print(f"{Colors.WARNING}[DEBUG] Checking: {url}{Colors.ENDC}")
-            
-            response = page.goto(url, timeout=15000, wait_until='networkidle')
-            
-            # Wait a bit more for JS to render
-            page.wait_for_timeout(2000)
-            
-            # Get page content and current URL (in case of redirects)
-            content = page.content().lower()
-            current_url = page.url
-            
-            browser.close()
-            
-            # Check for success indicators
-            success_indicators = site_config.get("success_indicators", [])
-            failure_indicators = site_config.get("failure_indicators", [])
-            
-            # Check failure indicators first
-            for indicator in failure_indicators:
-                if indicator.lower() in content:
-                    print(f"{Colors.WARNING}[DEBUG] Found failure indicator: {indicator}{Colors.ENDC}")
-                    return False, "Not Found"
-            
-            # Check success indicators
-            for indicator in success_indicators:
-                formatted_indicator = indicator.format(username).lower()
-                if formatted_indicator in content:
-                    print(f"{Colors.WARNING}[DEBUG] Found success indicator: {indicator}{Colors.ENDC}")
-                    return True, url
-            
-            # For GitHub API and simple cases, check status code
-            if response and response.status == 200:
-                # Additional checks for specific platforms
-                if "snapchat.com" in url:
-                    # For Snapchat, if we didn't get redirected to explore page, it's likely valid
-                    if "/explore/" not in current_url and username.lower() in current_url.lower():
-                        return True, url
-                elif "instagram.com" in url:
-                    # Instagram specific: check if we're still on the profile page
-                    if f"/{username}/" in current_url and "login" not in current_url:
-                        return True, url
-                elif "x.com" in url or "twitter.com" in url:
-                    # Twitter/X: check if we're still on the profile URL
-                    if f"/{username}" in current_url and "home" not in current_url:
-                        return True, url
-            
-            return False, "Not Found"
-            
+        return await stack.enter_async_context(BrowserPool(min(browser_checks, MAX_BROWSER_CONTEXTS)))
     except Exception as e:
-        print(f"{Colors.WARNING}[DEBUG] Playwright error: {str(e)}{Colors.ENDC}")
-        return False, "Error checking"
+        # Reported once here; each browser check then comes back as an error
+        log.warning("%s[!] Could not start browser: %s%s", Colors.WARNING, e, Colors.ENDC)
+        return None
 
-def check_with_requests(username, site_config):
-    """Enhanced requests checking"""
+def materialize(site_config, username):
+    """Resolve a site's URL and indicators for one username, once per check"""
+    token = os.environ.get(site_config.get("token_env", ""))
+    return {
+        "config": site_config,
+        "username": username,
+        "url": site_config["url"].format(username),
+        "headers": {"Authorization": f"Bearer {token}"} if token else {},
+        "success": tuple(i.format(username) for i in site_config.get("success_indicators", [])),
+        "failure": tuple(site_config.get("failure_indicators", [])),
+        "failure_re": site_config["_failure_re"],
+        "failure_overlap": site_config["_failure_overlap"],
+    }
+
+async def check_with_playwright(pool, target):
+    """Enhanced Playwright checking with better detection"""
+    page = None
     try:
-        url = site_config["url"].format(username)
+        page = await pool.acquire_page()
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+        # Navigate to the URL
+        url = target["url"]
+        username = target["username"]
+        log.debug("%s[DEBUG] Checking: %s%s", Colors.WARNING, url, Colors.ENDC)
+        
+        response = await page.goto(url, timeout=15000, wait_until='domcontentloaded')
+        if response and response.status == 429:
+            return False, "Rate limited"
+        
+        # Only wait for JS rendering when the site's indicator lives in the DOM
+        dom_selector = target["config"].get("dom_selector")
+        if dom_selector:
+            try:
+                await page.wait_for_selector(dom_selector, timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
         
-        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+        # Check failure text first; queried in the browser, no HTML copy
+        for indicator in target["failure"]:
+            if await page.get_by_text(indicator).first.is_visible():
+                log.debug("%s[DEBUG] Found failure indicator: %s%s", Colors.WARNING, indicator, Colors.ENDC)
+                return False, "Not Found"
         
-        # GitHub API returns 404 for non-existent users
-        if "api.github.com" in url:
-            return response.status_code == 200, url if response.status_code == 200 else "Not Found"
+        # Success indicators are CSS selectors
+        for indicator in target["success"]:
+            if await page.locator(indicator).count() > 0:
+                log.debug("%s[DEBUG] Found success indicator: %s%s", Colors.WARNING, indicator, Colors.ENDC)
+                return True, url
         
-        # For other sites, check content
-        if response.status_code == 200:
-            content = response.text.lower()
+        # Fall back to the site's own check of where we landed (in case of redirects)
+        landed = target["config"].get("landed")
+        if landed and response and response.status == 200 and landed(page.url, username):
+            return True, url
+        
+        return False, "Not Found"
+        
+    except Exception as e:
+        log.warning("%s[!] Playwright error: %s%s", Colors.WARNING, e, Colors.ENDC)
+        return False, "Error checking"
+    finally:
+        # Nothing to hand back if opening the page failed
+        if page is not None:
+            await pool.release_page(page)
+
+def create_session(limiter):
+    """Shared aiohttp session: pooled keep-alive connections and default headers"""
+    connector = aiohttp.TCPConnector(limit=16, limit_per_host=4, ttl_dns_cache=300)
+    
+    # Feed every response's rate-limit headers back into the host limiter
+    async def on_request_end(session, trace_ctx, params):
+        limiter.update_from_headers(str(params.url), params.response.headers)
+    
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    return aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS, timeout=aiohttp.ClientTimeout(total=10), trace_configs=[trace_config])
+
+async def http_probe(session, target):
+    """Resolve a browser site over plain HTTP; None if inconclusive"""
+    try:
+        async with request_with_retry(session, "GET", target["url"], allow_redirects=False) as response:
+            return target["config"]["probe"](response.status, response.headers.get("Location", ""), target["username"])
             
-            # Check failure indicators
-            failure_indicators = site_config.get("failure_indicators", [])
-            for indicator in failure_indicators:
-                if indicator.lower() in content:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.debug("%s[DEBUG] Probe error: %s%s", Colors.WARNING, e, Colors.ENDC)
+        return None
+
+async def fetch_status(session, url, headers=None):
+    """Status code and headers for url via HEAD, without downloading the body"""
+    async with request_with_retry(session, "HEAD", url, headers=headers, allow_redirects=True) as response:
+        if response.status not in (405, 501):
+            return response.status, response.headers
+    
+    # Server rejects HEAD: GET, read the status line and drop the body
+    async with request_with_retry(session, "GET", url, headers=headers, allow_redirects=True) as response:
+        response.close()
+        return response.status, response.headers
+
+# Read size for streamed response bodies
+CHUNK_SIZE = 8192
+
+async def body_matches(response, pattern, overlap):
+    """Stream the response body, stopping at the first pattern match"""
+    tail = b""
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        buf = tail + chunk
+        if pattern.search(buf):
+            # Drop the rest of the body instead of downloading it
+            response.close()
+            return True
+        tail = buf[-overlap:] if overlap else b""
+    return False
+
+async def check_with_aiohttp(session, target):
+    """Enhanced aiohttp checking"""
+    try:
+        url = target["url"]
+        
+        # Sites like the GitHub API answer 404 for missing users, no body needed
+        if target["config"].get("status_only"):
+            status, response_headers = await fetch_status(session, url, target["headers"])
+            return (True, url) if status == 200 else status_result(status, response_headers)
+        
+        async with request_with_retry(session, "GET", url, headers=target["headers"], allow_redirects=True) as response:
+            # Check content
+            if response.status == 200:
+                # Check failure indicators, all in a single pass
+                failure_re = target["failure_re"]
+                if failure_re and await body_matches(response, failure_re, target["failure_overlap"]):
                     return False, "Not Found"
+                
+                return True, url
+            else:
+                return status_result(response.status, response.headers)
             
-            return True, url
-        else:
-            return False, "Not Found"
-            
-    except requests.RequestException as e:
-        print(f"{Colors.WARNING}[DEBUG] Requests error: {str(e)}{Colors.ENDC}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.warning("%s[!] Requests error: %s%s", Colors.WARNING, e, Colors.ENDC)
         return False, "Error checking"
 
-def check_username(username, sites):
-    """Main function to check username across sites"""
-    results = {}
+async def check_site(session, limiter, pool, site_name, target):
+    """Check a single site using its configured method"""
+    site_config = target["config"]
+    url = target["url"]
+    method = site_config.get("method", "requests")
     
-    for site_name, site_config in sites.items():
-        print(f"{Colors.OKBLUE}[*] Checking {site_name}...{Colors.ENDC}")
-        
-        method = site_config.get("method", "requests")
+    async with limiter.limit(url, site_config.get("min_interval", 0)):
+        log.info("%s[*] Checking %s for %s...%s", Colors.OKBLUE, site_name, target["username"], Colors.ENDC)
         
         if method == "playwright":
-            found, message = check_with_playwright(username, site_config)
-        else:
-            found, message = check_with_requests(username, site_config)
+            # Try a single cheap request before falling back to the browser
+            if "probe" in site_config:
+                found = await http_probe(session, target)
+                if found is not None:
+                    return found, url if found else "Not Found"
+            if pool is None:
+                return False, "Error checking"
+            return await check_with_playwright(pool, target)
+        return await check_with_aiohttp(session, target)
+
+async def check_usernames(usernames, sites, cache):
+    """Check every username across sites in a single concurrent batch"""
+    results = {username: {} for username in usernames}
+    pending = []
+    
+    for username in usernames:
+        for site_name, site_config in sites.items():
+            cached = cache.get(site_name, username)
+            if cached is not None:
+                log.info("%s[*] %s for %s: using cached result%s", Colors.OKBLUE, site_name, username, Colors.ENDC)
+                results[username][site_name] = cached
+            else:
+                pending.append((username, site_name, materialize(site_config, username)))
+    
+    if pending:
+        # Size the browser for what the cache didn't answer; none if nothing needs it
+        browser_checks = sum(1 for _, _, target in pending if target["config"].get("method") == "playwright")
+        # One session and limiter shared by every probe, so per-host limits hold across usernames
+        limiter = HostLimiter()
+        async with AsyncExitStack() as stack:
+            pool = await open_browser_pool(stack, browser_checks)
+            session = await stack.enter_async_context(create_session(limiter))
+            tasks = [check_site(session, limiter, pool, site_name, target) for _, site_name, target in pending]
+            outcomes = await asyncio.gather(*tasks)
         
-        results[site_name] = (found, message)
+        for (username, site_name, _), outcome in zip(pending, outcomes):
+            cache.set(site_name, username, outcome)
+            results[username][site_name] = outcome
+    
+    # Keep the configured site order for the summary
+    return {username: {site_name: results[username][site_name] for site_name in sites} for username in usernames}
+
+async def run_checks(usernames, choice):
+    """Check each username against the chosen category and print the results"""
+    selected_sites = CATEGORIES[choice]["sites"]
+    cache = ResultCache()
+
+    log.info(HEADER_TMPL.format(users=", ".join(usernames), category=CATEGORIES[choice]["name"]))
+
+    all_results = await check_usernames(usernames, selected_sites, cache)
+    cache.save()
+
+    for username, results in all_results.items():
+        found_count = sum(1 for status, _ in results.values() if status)
+        total_sites = len(results)
+        possibility_score = round((found_count / total_sites) * 100, 2) if total_sites > 0 else 0
+
+        # Build the whole summary, then emit it as one record
+        lines = [RESULTS_TMPL.format(username=username)]
         
-        # small delay to avoid rate limiting
-        time.sleep(1)
+        for site, (status, message) in results.items():
+            if status:
+                lines.append(FOUND_TMPL.format(site=site, message=message))
+            elif message == "Not Found":
+                lines.append(NOT_FOUND_TMPL.format(site=site))
+            else:
+                lines.append(UNKNOWN_TMPL.format(site=site, message=message))
+
+        lines.append(SCORE_TMPL.format(score=possibility_score))
+        lines.append(TIP_TMPL.format(tip=OSINT_TIPS[random.randrange(len(OSINT_TIPS))]))
+        log.info("\n".join(lines))
+
+def run_async(coro):
+    """asyncio.run, on a uvloop event loop when uvloop is installed"""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(coro)
+
+def setup_logging():
+    """Send log records through a queue so tasks never block on stdout"""
+    records = queue.Queue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, handler)
     
-    return results
+    log.addHandler(logging.handlers.QueueHandler(records))
+    log.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+    log.propagate = False
+    listener.start()
+    return listener
 
 def main():
     if len(sys.argv) < 2 or len(sys.argv) > 4:
         print(f"{Colors.FAIL}Usage: python osint_checker.py <username1> [username2] [username3]{Colors.ENDC}")
         sys.exit()
 
-    usernames = sys.argv[1:]
+    # Drop repeated usernames, each one is only checked once
+    usernames = list(dict.fromkeys(sys.argv[1:]))
 
-    print(f"\n{Colors.OKBLUE}{Colors.BOLD}🔍 OSINT Recon CLI Tool{Colors.ENDC}")
-    print(f"{Colors.OKBLUE}{Colors.BOLD}Choose category to check:{Colors.ENDC}")
-    print("1 - Social Sites (Instagram, Facebook, Twitter, Snapchat)")
-    print("2 - Tech Side (LinkedIn, GitHub)")
-    print("3 - All Sites")
+    print(MENU)
     choice = input("Enter your choice (1/2/3): ")
 
     if choice not in CATEGORIES:
         print(f"{Colors.FAIL}Invalid choice. Exiting...{Colors.ENDC}")
         sys.exit()
 
-    selected_sites = CATEGORIES[choice]["sites"]
-
-    for username in usernames:
-        print(f"\n{Colors.OKBLUE}{'='*50}{Colors.ENDC}")
-        print(f"{Colors.OKBLUE}[*] Checking username: {Colors.BOLD}{username}{Colors.ENDC}{Colors.OKBLUE} across {CATEGORIES[choice]['name']}...{Colors.ENDC}")
-        print(f"{Colors.OKBLUE}{'='*50}{Colors.ENDC}")
-        
-        results = check_username(username, selected_sites)
-
-        found_count = sum(1 for status, _ in results.values() if status)
-        total_sites = len(results)
-        possibility_score = round((found_count / total_sites) * 100, 2) if total_sites > 0 else 0
-
-        print(f"\n{Colors.BOLD}📊 Results for {username}:{Colors.ENDC}")
-        print("-" * 40)
-        
-        for site, (status, message) in results.items():
-            if status:
-                print(f"{Colors.OKGREEN}✅ [Found] {site}: {message}{Colors.ENDC}")
-            else:
-                print(f"{Colors.FAIL}❌ [Not Found] {site}{Colors.ENDC}")
-
-        print(f"\n{Colors.OKBLUE}📈 Possibility Score: {Colors.BOLD}{possibility_score}%{Colors.ENDC}")
-        print(f"{Colors.OKBLUE}💡 OSINT Tip: {random.choice(OSINT_TIPS)}{Colors.ENDC}")
+    listener = setup_logging()
+    try:
+        run_async(run_checks(usernames, choice))
+    finally:
+        # Drains any queued records before exit
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file